@@ -162,6 +162,9 @@ async def main() -> None:
     camera_matrix: np.ndarray = detector.get_camera_matrix(calibration.camera_data[0])
     distortion_coeff = np.array(calibration.camera_data[0].distortion_coeff)
 
+    # create the window once, outside of the streaming loop
+    cv2.namedWindow("image", cv2.WINDOW_NORMAL)
+
     async for event, message in camera_client.subscribe(config.subscriptions[0], decode=True):
         # cast image data bytes to numpy and decode
         image: np.ndarray = cv2.imdecode(np.frombuffer(message.image_data, dtype="uint8"), cv2.IMREAD_UNCHANGED)
@@ -170,10 +173,9 @@ async def main() -> None:
         # NOTE: do something with the detections here, e.g. publish them to the event service
         detections, image_vis = detector.detect_pose(image, camera_matrix, distortion_coeff)
 
-        # visualize the image
-        cv2.namedWindow("image", cv2.WINDOW_NORMAL)
+        # visualize the image, polling the GUI events without blocking the event loop
         cv2.imshow("image", image_vis)
-        cv2.waitKey(1)
+        cv2.pollKey()
 
 
 if __name__ == "__main__":
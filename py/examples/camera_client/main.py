@@ -36,6 +36,9 @@ async def main(service_config_path: Path) -> None:
     # Create a client to the camera service
     config: EventServiceConfig = proto_from_json_file(service_config_path, EventServiceConfig())
 
+    # Create the window once, outside of the streaming loop
+    cv2.namedWindow("image", cv2.WINDOW_NORMAL)
+
     async for event, message in EventClient(config).subscribe(config.subscriptions[0], decode=True):
         # Find the monotonic driver receive timestamp, or the first timestamp if not available.
         stamp = (
@@ -53,10 +56,9 @@ async def main(service_config_path: Path) -> None:
         if event.uri.path == "/disparity":
             image = cv2.applyColorMap(image * 3, cv2.COLORMAP_JET)
 
-        # Visualize the image
-        cv2.namedWindow("image", cv2.WINDOW_NORMAL)
+        # Visualize the image, polling the GUI events without blocking the event loop
         cv2.imshow("image", image)
-        cv2.waitKey(1)
+        cv2.pollKey()
 
 
 if __name__ == "__main__":
@@ -51,4 +51,12 @@ if __name__ == "__main__":
     parser.add_argument("--service-config", type=Path, required=True, help="The canbus service config.")
     args = parser.parse_args()
 
+    # use the libuv-based event loop when it is available
+    try:
+        import uvloop
+
+        uvloop.install()
+    except ImportError:
+        pass
+
     asyncio.run(main(args.service_config))
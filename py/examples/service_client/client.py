@@ -39,4 +39,12 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
+    # use the libuv-based event loop when it is available
+    try:
+        import uvloop
+
+        uvloop.install()
+    except ImportError:
+        pass
+
     asyncio.run(main())
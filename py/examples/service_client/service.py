@@ -26,6 +26,8 @@ from farm_ng.core.events_file_reader import proto_from_json_file
 from google.protobuf.empty_pb2 import Empty
 from google.protobuf.message import Message
 
+_EMPTY = Empty()
+
 
 class AddTwoIntServer:
     """A simple service that implements the AddTwoInts service."""
@@ -51,30 +53,43 @@ class AddTwoIntServer:
 
             return two_ints_pb2.AddTwoIntsResponse(sum=message.a + message.b)
 
-        return Empty()
+        return _EMPTY
 
     async def serve(self) -> None:
         """Serve the service."""
         await self._event_service.serve()
 
 
+async def main(service_config: EventServiceConfig) -> None:
+    """Run the AddTwoInts service.
+
+    Args:
+        service_config: The service config.
+    """
+    # create the grpc server inside the running event loop, so it is bound to it
+    event_service: EventServiceGrpc = EventServiceGrpc(grpc.aio.server(), service_config)
+
+    # wrap and run the service
+    await AddTwoIntServer(event_service).serve()
+
+
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(prog="python service.py", description="Farm-ng how to create a service example.")
     parser.add_argument("--service-config", type=Path, required=True, help="The service config.")
     args = parser.parse_args()
 
-    # load the service config
-    service_config: EventServiceConfig = proto_from_json_file(args.service_config, EventServiceConfig())
+    # use the libuv-based event loop when it is available
+    try:
+        import uvloop
 
-    # create the grpc server
-    event_service: EventServiceGrpc = EventServiceGrpc(grpc.aio.server(), service_config)
+        uvloop.install()
+    except ImportError:
+        pass
 
-    loop = asyncio.get_event_loop()
+    # load the service config
+    service_config: EventServiceConfig = proto_from_json_file(args.service_config, EventServiceConfig())
 
     try:
-        # wrap and run the service
-        loop.run_until_complete(AddTwoIntServer(event_service).serve())
+        asyncio.run(main(service_config))
     except KeyboardInterrupt:
         print("Exiting...")
-    finally:
-        loop.close()
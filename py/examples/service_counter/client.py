@@ -25,6 +25,9 @@ from farm_ng.core.events_file_reader import proto_from_json_file
 from farm_ng.core.uri_pb2 import Uri
 from google.protobuf.empty_pb2 import Empty
 
+_SUBSCRIBE_REQUEST = SubscribeRequest(uri=Uri(path="/counter"), every_n=1)
+_EMPTY = Empty()
+
 
 class CounterClient:
     def __init__(self, service_config: EventServiceConfig) -> None:
@@ -37,9 +40,7 @@ class CounterClient:
 
     async def subscribe(self) -> None:
         """Run the main task."""
-        async for event, message in self._event_client.subscribe(
-            request=SubscribeRequest(uri=Uri(path="/counter"), every_n=1), decode=True
-        ):
+        async for event, message in self._event_client.subscribe(request=_SUBSCRIBE_REQUEST, decode=True):
             print(f"Received message: {message}")
 
 
@@ -50,7 +51,7 @@ async def command_subscribe(client: CounterClient) -> None:
 
 async def command_reset(client: CounterClient) -> None:
     """Reset the counter."""
-    await client._event_client.request_reply("/reset_counter", Empty())
+    await client._event_client.request_reply("/reset_counter", _EMPTY)
 
 
 if __name__ == "__main__":
@@ -65,6 +66,14 @@ if __name__ == "__main__":
 
     args = parser.parse_args()
 
+    # use the libuv-based event loop when it is available
+    try:
+        import uvloop
+
+        uvloop.install()
+    except ImportError:
+        pass
+
     # load the service config
     service_config: EventServiceConfig = proto_from_json_file(args.service_config, EventServiceConfig())
 
@@ -27,6 +27,8 @@ from google.protobuf.empty_pb2 import Empty
 from google.protobuf.message import Message
 from google.protobuf.wrappers_pb2 import Int32Value
 
+_EMPTY = Empty()
+
 
 class CounterServer:
     def __init__(self, event_service: EventServiceGrpc) -> None:
@@ -40,42 +42,66 @@ class CounterServer:
 
         self._counter: int = 0
         self._rate: float = 1.0
+        self._period: float = 1.0 / self._rate
 
     async def request_reply_handler(self, event: Event, message: Message) -> None:
         """The callback for handling request/reply messages."""
         if event.uri.path == "/reset_counter":
             self._counter = 0
 
-        return Empty()
+        return _EMPTY
 
     async def run(self) -> None:
         """Run the main task."""
+        loop = asyncio.get_running_loop()
+        publish = self._event_service.publish
+        period: float = self._period
+        message = Int32Value()
+
+        # sleep until a fixed deadline so the time spent publishing does not accumulate as drift,
+        # but never schedule it in the past, so a stall costs one late tick rather than a burst of publishes
+        next_time: float = loop.time()
         while True:
-            await self._event_service.publish("/counter", Int32Value(value=self._counter))
+            message.value = self._counter
+            await publish("/counter", message)
             self._counter += 1
-            await asyncio.sleep(1.0 / self._rate)
+            next_time = max(next_time + period, loop.time())
+            await asyncio.sleep(max(0.0, next_time - loop.time()))
 
     async def serve(self) -> None:
         await asyncio.gather(self._event_service.serve(), self.run())
 
 
+async def main(service_config: EventServiceConfig) -> None:
+    """Run the counter service.
+
+    Args:
+        service_config: The service config.
+    """
+    # create the grpc server inside the running event loop, so it is bound to it
+    event_service: EventServiceGrpc = EventServiceGrpc(grpc.aio.server(), service_config)
+
+    # wrap and run the service
+    await CounterServer(event_service).serve()
+
+
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(prog="python counter.py", description="Farm-ng counter service example.")
     parser.add_argument("--service-config", type=Path, required=True, help="The service list config.")
     args = parser.parse_args()
 
-    # load the service config
-    service_config: EventServiceConfig = proto_from_json_file(args.service_config, EventServiceConfig)
+    # use the libuv-based event loop when it is available
+    try:
+        import uvloop
 
-    # create the grpc server
-    event_service: EventServiceGrpc = EventServiceGrpc(grpc.aio.server(), service_config)
+        uvloop.install()
+    except ImportError:
+        pass
 
-    loop = asyncio.get_event_loop()
+    # load the service config
+    service_config: EventServiceConfig = proto_from_json_file(args.service_config, EventServiceConfig)
 
     try:
-        # wrap and run the service
-        loop.run_until_complete(CounterServer(event_service).serve())
+        asyncio.run(main(service_config))
     except KeyboardInterrupt:
         print("Exiting...")
-    finally:
-        loop.close()
@@ -26,7 +26,9 @@ from farm_ng.core.event_service_pb2 import EventServiceConfig
 from farm_ng.core.event_service_pb2 import EventServiceConfigList
 from farm_ng.core.events_file_reader import proto_from_json_file
 from google.protobuf.empty_pb2 import Empty
-from google.protobuf.struct_pb2 import Struct
+from sample_pb2 import Sample
+
+_EMPTY = Empty()
 
 
 class AgentServer:
@@ -39,44 +41,75 @@ class AgentServer:
         self._event_service = event_service
         self._event_service.add_request_reply_handler(self.request_reply_handler)
 
-        args: dict[str, float] = {}
-        for arg in self._event_service.config.args:
-            key, value = arg.split("=")
-            args[key] = value
+        args: dict[str, str] = {
+            key: value for key, _, value in (arg.partition("=") for arg in self._event_service.config.args)
+        }
 
         # the rate in hertz to send commands
         self._rate = float(args["rate"])
+        self._period = 1.0 / self._rate
         self._num_tasks = int(args["num_tasks"])
 
-        self._remainder: int = 1e6
+        self._remainder: int = 1_000_000
+
+        # set while there is storage budget left, so the tasks can wait on it instead of polling
+        self._has_budget = asyncio.Event()
+        self._has_budget.set()
 
     async def request_reply_handler(self, event: Event, message) -> None:
         """The callback for handling request/reply messages."""
         if event.uri.path == "/update_residual":
             self._remainder = message.value
+            if self._remainder > 0:
+                self._has_budget.set()
+            else:
+                self._has_budget.clear()
             self._event_service.logger.info(f"Remainder: {self._remainder}")
 
-        return Empty()
+        return _EMPTY
 
     async def run_task(self, task_id: int) -> None:
         """Run the main task."""
+        # reuse one message per task, publish() serializes it before returning
+        message = Sample(task_id=task_id)
+
+        loop = asyncio.get_running_loop()
+        publish = self._event_service.publish
+        period: float = self._period
+        rand = random.random
+
+        # sleep until a fixed deadline so the time spent publishing does not accumulate as drift,
+        # but never schedule it in the past, so a stall costs one late tick rather than a burst of publishes
+        next_time: float = loop.time()
         while True:
             if self._remainder <= 0:
-                await asyncio.sleep(0.01)
+                await self._has_budget.wait()
+                next_time = loop.time()
                 continue
 
-            message = Struct()
-            message["sample"] = random.random()
-            message["task_id"] = task_id
+            message.sample = rand()
 
-            await self._event_service.publish("/sample", message)
-            await asyncio.sleep(1.0 / self._rate)
-            print(f"Published sample {message['sample']} from task {task_id}")
+            await publish("/sample", message)
+            next_time = max(next_time + period, loop.time())
+            await asyncio.sleep(max(0.0, next_time - loop.time()))
+            self._event_service.logger.debug("Published sample %s from task %s", message.sample, task_id)
 
     async def serve(self) -> None:
         """Run the service."""
-        tasks: list[asyncio.Task] = [asyncio.create_task(self.run_task(i)) for i in range(self._num_tasks)]
-        await asyncio.gather(self._event_service.serve(), *tasks)
+        await asyncio.gather(self._event_service.serve(), *(self.run_task(i) for i in range(self._num_tasks)))
+
+
+async def main(service_config: EventServiceConfig) -> None:
+    """Run the agent service.
+
+    Args:
+        service_config: The service config.
+    """
+    # create the grpc server inside the running event loop, so it is bound to it
+    event_service: EventServiceGrpc = EventServiceGrpc(grpc.aio.server(), service_config)
+
+    # wrap and run the service
+    await AgentServer(event_service).serve()
 
 
 if __name__ == "__main__":
@@ -85,27 +118,24 @@ if __name__ == "__main__":
     parser.add_argument("--service-name", type=str, required=True, help="The service name.")
     args = parser.parse_args()
 
+    # use the libuv-based event loop when it is available
+    try:
+        import uvloop
+
+        uvloop.install()
+    except ImportError:
+        pass
+
     # load the service config
     config_list: EventServiceConfigList = proto_from_json_file(args.service_config, EventServiceConfigList())
 
-    service_config: EventServiceConfig | None = None
-    for config in config_list.configs:
-        if config.name == args.service_name:
-            service_config = config
-            break
+    configs: dict[str, EventServiceConfig] = {config.name: config for config in config_list.configs}
+    service_config: EventServiceConfig | None = configs.get(args.service_name)
 
     if service_config is None:
         raise RuntimeError(f"Service '{args.service_name}' not found in config.")
 
-    # create the grpc server
-    event_service: EventServiceGrpc = EventServiceGrpc(grpc.aio.server(), service_config)
-
-    loop = asyncio.get_event_loop()
-
     try:
-        # wrap and run the service
-        loop.run_until_complete(AgentServer(event_service).serve())
+        asyncio.run(main(service_config))
     except KeyboardInterrupt:
         print("Exiting...")
-    finally:
-        loop.close()
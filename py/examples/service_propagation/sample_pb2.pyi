@@ -0,0 +1,13 @@
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from typing import ClassVar as _ClassVar, Optional as _Optional
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class Sample(_message.Message):
+    __slots__ = ("sample", "task_id")
+    SAMPLE_FIELD_NUMBER: _ClassVar[int]
+    TASK_ID_FIELD_NUMBER: _ClassVar[int]
+    sample: float
+    task_id: int
+    def __init__(self, sample: _Optional[float] = ..., task_id: _Optional[int] = ...) -> None: ...
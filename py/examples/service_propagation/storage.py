@@ -27,6 +27,8 @@ from farm_ng.core.events_file_reader import proto_from_json_file
 from google.protobuf.empty_pb2 import Empty
 from google.protobuf.wrappers_pb2 import Int32Value
 
+_EMPTY = Empty()
+
 
 class StorageServer:
     def __init__(self, event_service: EventServiceGrpc) -> None:
@@ -40,10 +42,12 @@ class StorageServer:
 
         self._storage: int = 0
 
-        args: dict[str, float] = {}
-        for arg in self._event_service.config.args:
-            key, value = arg.split("=")
-            args[key] = value
+        # the reply to /update_storage, reused since it is serialized as soon as the handler returns
+        self._residual_reply = Int32Value()
+
+        args: dict[str, str] = {
+            key: value for key, _, value in (arg.partition("=") for arg in self._event_service.config.args)
+        }
 
         # the maximum storage capacity
         self._max_storage = int(args["max_storage"])
@@ -51,35 +55,48 @@ class StorageServer:
         # the batch size to remove from storage
         self._batch_size = int(args["batch_size"])
 
+        # set while a full batch is in storage, so it can be removed without polling
+        self._has_batch = asyncio.Event()
+
     async def request_reply_handler(self, event: Event, message: Empty) -> None:
         """The callback for handling request/reply messages."""
         if event.uri.path == "/update_storage":
             self._storage += 1
+            if self._storage >= self._batch_size:
+                self._has_batch.set()
             residual: int = self._max_storage - self._storage
             self._event_service.logger.info(f"Storage: {self._storage}/{self._max_storage} ({residual} remaining)")
-            return Int32Value(value=residual)
+            self._residual_reply.value = residual
+            return self._residual_reply
 
-        return Empty()
+        return _EMPTY
 
     async def remove_from_storage(self) -> None:
         """Remove from storage."""
         while True:
-            if self._storage < self._batch_size:
-                await asyncio.sleep(0.05)
-                continue
+            await self._has_batch.wait()
 
             self._storage -= self._batch_size
+            if self._storage < self._batch_size:
+                self._has_batch.clear()
 
             self._event_service.logger.info(f"Removed from storage: {self._batch_size}/{self._max_storage}")
 
-            await asyncio.sleep(0.1)
-
     async def serve(self) -> None:
-        tasks: list[asyncio.Task] = [
-            asyncio.create_task(self._event_service.serve()),
-            asyncio.create_task(self.remove_from_storage()),
-        ]
-        await asyncio.gather(*tasks)
+        await asyncio.gather(self._event_service.serve(), self.remove_from_storage())
+
+
+async def main(service_config: EventServiceConfig) -> None:
+    """Run the storage service.
+
+    Args:
+        service_config: The service config.
+    """
+    # create the grpc server inside the running event loop, so it is bound to it
+    event_service: EventServiceGrpc = EventServiceGrpc(grpc.aio.server(), service_config)
+
+    # wrap and run the service
+    await StorageServer(event_service).serve()
 
 
 if __name__ == "__main__":
@@ -90,27 +107,24 @@ if __name__ == "__main__":
     parser.add_argument("--service-name", type=str, required=True, help="The service name.")
     args = parser.parse_args()
 
+    # use the libuv-based event loop when it is available
+    try:
+        import uvloop
+
+        uvloop.install()
+    except ImportError:
+        pass
+
     # load the service config
     config_list: EventServiceConfigList = proto_from_json_file(args.service_config, EventServiceConfigList())
 
-    service_config: EventServiceConfig | None = None
-    for config in config_list.configs:
-        if config.name == args.service_name:
-            service_config = config
-            break
+    configs: dict[str, EventServiceConfig] = {config.name: config for config in config_list.configs}
+    service_config: EventServiceConfig | None = configs.get(args.service_name)
 
     if service_config is None:
         raise RuntimeError(f"Service '{args.service_name}' not found in config.")
 
-    # create the grpc server
-    event_service: EventServiceGrpc = EventServiceGrpc(grpc.aio.server(), service_config)
-
-    loop = asyncio.get_event_loop()
-
     try:
-        # wrap and run the service
-        loop.run_until_complete(StorageServer(event_service).serve())
+        asyncio.run(main(service_config))
     except KeyboardInterrupt:
         print("Exiting...")
-    finally:
-        loop.close()
@@ -26,6 +26,8 @@ from farm_ng.core.event_service_pb2 import EventServiceConfigList
 from farm_ng.core.events_file_reader import proto_from_json_file
 from google.protobuf.empty_pb2 import Empty
 
+_EMPTY = Empty()
+
 
 class SupervisorServer:
     def __init__(self, event_service: EventServiceGrpc, config_list: EventServiceConfigList) -> None:
@@ -42,10 +44,9 @@ class SupervisorServer:
             if config.name != event_service.config.name
         }
 
-        args: dict[str, float] = {}
-        for arg in self._event_service.config.args:
-            key, value = arg.split("=")
-            args[key] = value
+        args: dict[str, str] = {
+            key: value for key, _, value in (arg.partition("=") for arg in self._event_service.config.args)
+        }
 
         # the rate in hertz to send commands
         self._confidence = float(args["confidence"])
@@ -55,19 +56,35 @@ class SupervisorServer:
         # create the event client
         service_name = subscripton.uri.query.split("=")[-1]
         client = self._clients[service_name]
+        storage_client = self._clients["storage"]
+        confidence: float = self._confidence
 
         async for event, message in client.subscribe(subscripton, decode=True):
-            if message["sample"] > self._confidence:
-                residual = await self._clients["storage"].request_reply("/update_storage", Empty(), decode=True)
+            if message.sample > confidence:
+                residual = await storage_client.request_reply("/update_storage", _EMPTY, decode=True)
                 self._event_service.logger.info(f"Residual: {residual}")
                 await client.request_reply("/update_residual", residual)
 
     async def serve(self) -> None:
         """Run the service."""
-        tasks: list[asyncio.Task] = []
-        for subscription in self._event_service.config.subscriptions:
-            tasks.append(asyncio.create_task(self.subscribe(subscription)))
-        await asyncio.gather(self._event_service.serve(), *tasks)
+        await asyncio.gather(
+            self._event_service.serve(),
+            *(self.subscribe(subscription) for subscription in self._event_service.config.subscriptions),
+        )
+
+
+async def main(service_config: EventServiceConfig, config_list: EventServiceConfigList) -> None:
+    """Run the supervisor service.
+
+    Args:
+        service_config: The service config.
+        config_list: The service list config, used to create the clients.
+    """
+    # create the grpc server inside the running event loop, so it is bound to it
+    event_service: EventServiceGrpc = EventServiceGrpc(grpc.aio.server(), service_config)
+
+    # wrap and run the service
+    await SupervisorServer(event_service, config_list).serve()
 
 
 if __name__ == "__main__":
@@ -78,27 +95,24 @@ if __name__ == "__main__":
     parser.add_argument("--service-name", type=str, required=True, help="The service name.")
     args = parser.parse_args()
 
+    # use the libuv-based event loop when it is available
+    try:
+        import uvloop
+
+        uvloop.install()
+    except ImportError:
+        pass
+
     # load the service config
     config_list: EventServiceConfigList = proto_from_json_file(args.service_config, EventServiceConfigList())
 
-    service_config: EventServiceConfig | None = None
-    for config in config_list.configs:
-        if config.name == args.service_name:
-            service_config = config
-            break
+    configs: dict[str, EventServiceConfig] = {config.name: config for config in config_list.configs}
+    service_config: EventServiceConfig | None = configs.get(args.service_name)
 
     if service_config is None:
         raise RuntimeError(f"Service '{args.service_name}' not found in config.")
 
-    # create the grpc server
-    event_service: EventServiceGrpc = EventServiceGrpc(grpc.aio.server(), service_config)
-
-    loop = asyncio.get_event_loop()
-
     try:
-        # wrap and run the service
-        loop.run_until_complete(SupervisorServer(event_service, config_list).serve())
+        asyncio.run(main(service_config, config_list))
     except KeyboardInterrupt:
         print("Exiting...")
-    finally:
-        loop.close()
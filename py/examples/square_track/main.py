@@ -34,6 +34,8 @@ from farm_ng_core_pybind import Pose3F64
 from farm_ng_core_pybind import Rotation3F64
 from google.protobuf.empty_pb2 import Empty
 
+_EMPTY = Empty()
+
 
 async def get_pose(clients: dict[str, EventClient]) -> Pose3F64:
     """Get the current pose of the robot in the world frame, from the filter service.
@@ -42,7 +44,7 @@ async def get_pose(clients: dict[str, EventClient]) -> Pose3F64:
         clients (dict[str, EventClient]): A dictionary of EventClients.
     """
     # We use the FilterState as the best source of the current pose of the robot
-    state: FilterState = await clients["filter"].request_reply("/get_state", Empty(), decode=True)
+    state: FilterState = await clients["filter"].request_reply("/get_state", _EMPTY, decode=True)
     print(f"Current filter state:\n{state}")
     return Pose3F64.from_proto(state.pose)
 
@@ -65,7 +67,7 @@ async def start(clients: dict[str, EventClient]) -> None:
         clients (dict[str, EventClient]): A dictionary of EventClients.
     """
     print("Sending request to start following the track...")
-    await clients["track_follower"].request_reply("/start", Empty())
+    await clients["track_follower"].request_reply("/start", _EMPTY)
 
 
 async def build_square(clients: dict[str, EventClient], side_length: float, clockwise: bool) -> Track:
@@ -93,23 +95,10 @@ async def build_square(clients: dict[str, EventClient], side_length: float, cloc
     world_pose_goal0: Pose3F64 = world_pose_robot * Pose3F64(a_from_b=Isometry3F64(), frame_a="robot", frame_b="goal0")
     track_waypoints.append(world_pose_goal0)
 
-    # Drive forward 1 meter (first side of the square)
-    track_waypoints.extend(create_straight_segment(track_waypoints[-1], "goal1", side_length))
-
-    # Turn left 90 degrees (first turn)
-    track_waypoints.extend(create_turn_segment(track_waypoints[-1], "goal2", angle))
-
-    # Add second side and turn
-    track_waypoints.extend(create_straight_segment(track_waypoints[-1], "goal3", side_length))
-    track_waypoints.extend(create_turn_segment(track_waypoints[-1], "goal4", angle))
-
-    # Add third side and turn
-    track_waypoints.extend(create_straight_segment(track_waypoints[-1], "goal5", side_length))
-    track_waypoints.extend(create_turn_segment(track_waypoints[-1], "goal6", angle))
-
-    # Add fourth side and turn
-    track_waypoints.extend(create_straight_segment(track_waypoints[-1], "goal7", side_length))
-    track_waypoints.extend(create_turn_segment(track_waypoints[-1], "goal8", angle))
+    # Add the four sides of the square, each followed by a 90 degree turn
+    for side in range(4):
+        track_waypoints.extend(create_straight_segment(track_waypoints[-1], f"goal{2 * side + 1}", side_length))
+        track_waypoints.extend(create_turn_segment(track_waypoints[-1], f"goal{2 * side + 2}", angle))
 
     # Return the list of waypoints as a Track proto message
     return format_track(track_waypoints)
@@ -127,33 +116,44 @@ def create_straight_segment(
         spacing (float): The spacing between waypoints, in meters.
 
     Returns:
-        Pose3F64: The poses of the straight segment.
+        list[Pose3F64]: The new poses of the straight segment, not including the previous pose.
     """
-    # Create a container to store the track segment waypoints
-    segment_poses: list[Pose3F64] = [previous_pose]
+    # Create a container to store the new track segment waypoints, chained from the previous pose
+    segment_poses: list[Pose3F64] = []
+    current_pose: Pose3F64 = previous_pose
 
     # For tracking the number of segments and remaining angle
     counter: int = 0
     remaining_distance: float = distance
 
+    # Every step but the last partial one is a full spacing, so build that step once
+    full_distance: float = copysign(spacing, distance)
+    full_isometry: Isometry3F64 = Isometry3F64([full_distance, 0, 0], Rotation3F64.Rz(0))
+
     while abs(remaining_distance) > 0.01:
-        # Compute the distance of the next segment
-        segment_distance: float = copysign(min(abs(remaining_distance), spacing), distance)
+        # Compute the distance and transform of the next segment
+        segment_distance: float
+        segment_isometry: Isometry3F64
+        if abs(remaining_distance) > spacing:
+            segment_distance, segment_isometry = full_distance, full_isometry
+        else:
+            segment_distance = copysign(abs(remaining_distance), distance)
+            segment_isometry = Isometry3F64([segment_distance, 0, 0], Rotation3F64.Rz(0))
 
         # Compute the next pose
         straight_segment: Pose3F64 = Pose3F64(
-            a_from_b=Isometry3F64([segment_distance, 0, 0], Rotation3F64.Rz(0)),
-            frame_a=segment_poses[-1].frame_b,
-            frame_b=f"{next_frame_b}_{counter}",
+            a_from_b=segment_isometry, frame_a=current_pose.frame_b, frame_b=f"{next_frame_b}_{counter}"
         )
-        segment_poses.append(segment_poses[-1] * straight_segment)
+        current_pose = current_pose * straight_segment
+        segment_poses.append(current_pose)
 
         # Update the counter and remaining angle
         counter += 1
         remaining_distance -= segment_distance
 
     # Rename the last pose to the desired name
-    segment_poses[-1].frame_b = next_frame_b
+    if segment_poses:
+        segment_poses[-1].frame_b = next_frame_b
     return segment_poses
 
 
@@ -168,33 +168,44 @@ def create_turn_segment(
         angle (float): The angle to turn, in radians (+ left, - right).
         spacing (float): The spacing between waypoints, in radians.
     Returns:
-        list[Pose3F64]: The poses of the turn segment.
+        list[Pose3F64]: The new poses of the turn segment, not including the previous pose.
     """
-    # Create a container to store the track segment waypoints
-    segment_poses: list[Pose3F64] = [previous_pose]
+    # Create a container to store the new track segment waypoints, chained from the previous pose
+    segment_poses: list[Pose3F64] = []
+    current_pose: Pose3F64 = previous_pose
 
     # For tracking the number of segments and remaining angle
     counter: int = 0
     remaining_angle: float = angle
 
+    # Every step but the last partial one is a full spacing, so build that step once
+    full_angle: float = copysign(spacing, angle)
+    full_isometry: Isometry3F64 = Isometry3F64.Rz(full_angle)
+
     while abs(remaining_angle) > 0.01:
-        # Compute the angle of the next segment
-        segment_angle: float = copysign(min(abs(remaining_angle), spacing), angle)
+        # Compute the angle and transform of the next segment
+        segment_angle: float
+        segment_isometry: Isometry3F64
+        if abs(remaining_angle) > spacing:
+            segment_angle, segment_isometry = full_angle, full_isometry
+        else:
+            segment_angle = copysign(abs(remaining_angle), angle)
+            segment_isometry = Isometry3F64.Rz(segment_angle)
 
         # Compute the next pose
         turn_segment: Pose3F64 = Pose3F64(
-            a_from_b=Isometry3F64.Rz(segment_angle),
-            frame_a=segment_poses[-1].frame_b,
-            frame_b=f"{next_frame_b}_{counter}",
+            a_from_b=segment_isometry, frame_a=current_pose.frame_b, frame_b=f"{next_frame_b}_{counter}"
         )
-        segment_poses.append(segment_poses[-1] * turn_segment)
+        current_pose = current_pose * turn_segment
+        segment_poses.append(current_pose)
 
         # Update the counter and remaining angle
         counter += 1
         remaining_angle -= segment_angle
 
     # Rename the last pose to the desired name
-    segment_poses[-1].frame_b = next_frame_b
+    if segment_poses:
+        segment_poses[-1].frame_b = next_frame_b
     return segment_poses
 
 
@@ -238,9 +249,10 @@ async def stream_track_state(clients: dict[str, EventClient]) -> None:
     # Note that this is not necessary in practice
     await asyncio.sleep(1.0)
 
-    # Subscribe to the track_follower state and print each
+    # Subscribe to the track_follower state and print every 10th message
+    # The service drops the rest, so they are never sent or decoded
     message: TrackFollowerState
-    async for _, message in clients["track_follower"].subscribe(SubscribeRequest(uri=Uri(path="/state"))):
+    async for _, message in clients["track_follower"].subscribe(SubscribeRequest(uri=Uri(path="/state"), every_n=10)):
         print("###################")
         print(message)
 
@@ -259,12 +271,8 @@ async def run(args) -> None:
         if config not in clients:
             raise RuntimeError(f"No {config} service config in {args.service_config}")
 
-    # Start the asyncio tasks
-    tasks: list[asyncio.Task] = [
-        asyncio.create_task(start_track(clients, args.side_length, args.clockwise)),
-        asyncio.create_task(stream_track_state(clients)),
-    ]
-    await asyncio.gather(*tasks)
+    # Run the asyncio tasks
+    await asyncio.gather(start_track(clients, args.side_length, args.clockwise), stream_track_state(clients))
 
 
 if __name__ == "__main__":
@@ -278,6 +286,13 @@ if __name__ == "__main__":
     )
     args = parser.parse_args()
 
-    # Create the asyncio event loop and run the main function
-    loop = asyncio.get_event_loop()
-    loop.run_until_complete(run(args))
+    # Use the libuv-based event loop when it is available
+    try:
+        import uvloop
+
+        uvloop.install()
+    except ImportError:
+        pass
+
+    # Run the main function
+    asyncio.run(run(args))
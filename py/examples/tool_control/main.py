@@ -18,9 +18,7 @@ import asyncio
 from pathlib import Path
 
 from farm_ng.canbus.tool_control_pb2 import ActuatorCommands
-from farm_ng.canbus.tool_control_pb2 import HBridgeCommand
 from farm_ng.canbus.tool_control_pb2 import HBridgeCommandType
-from farm_ng.canbus.tool_control_pb2 import PtoCommand
 from farm_ng.canbus.tool_control_pb2 import PtoCommandType
 from farm_ng.canbus.tool_control_pb2 import ToolStatuses
 from farm_ng.core.event_client import EventClient
@@ -28,25 +26,45 @@ from farm_ng.core.event_service_pb2 import EventServiceConfig
 from farm_ng.core.events_file_reader import proto_from_json_file
 from pynput import keyboard
 
+# H-bridge and PTO ids, selected by holding their key
+HBRIDGE_KEYS = frozenset({'0', '1', '2', '3'})
+PTO_KEYS = frozenset({'a', 'b', 'c', 'd'})
+PTO_ID_MAPPING = {'a': 0x0, 'b': 0x1, 'c': 0x2, 'd': 0x3}
+
+# Arrow keys select the command direction, space sets everything passive
+DIRECTION_KEYS = frozenset({'up', 'down', 'left', 'right', 'space'})
+
+# Commands indexed by whether the (forward, reverse) direction keys are pressed
+# Neither pressed has no entry, so the tools are omitted from the command => passive
+HBRIDGE_COMMANDS = {
+    (True, True): HBridgeCommandType.HBRIDGE_STOPPED,
+    (True, False): HBridgeCommandType.HBRIDGE_FORWARD,
+    (False, True): HBridgeCommandType.HBRIDGE_REVERSE,
+}
+PTO_COMMANDS = {
+    (True, True): PtoCommandType.PTO_STOPPED,
+    (True, False): PtoCommandType.PTO_FORWARD,
+    (False, True): PtoCommandType.PTO_REVERSE,
+}
+
 
 class KeyboardListener:
     def __init__(self):
         self.pressed_keys = set()
         self.listener = keyboard.Listener(on_press=self.on_press, on_release=self.on_release)
 
+    @staticmethod
+    def _key_name(key) -> str | None:
+        # Character keys have a char, special keys (e.g. arrows) have a name
+        return getattr(key, 'char', None) or getattr(key, 'name', None)
+
     def on_press(self, key):
-        try:
-            key_name = key.char
-        except AttributeError:
-            key_name = key.name  # For special keys
-        self.pressed_keys.add(key_name)
+        key_name = self._key_name(key)
+        if key_name is not None:
+            self.pressed_keys.add(key_name)
 
     def on_release(self, key):
-        try:
-            key_name = key.char
-        except AttributeError:
-            key_name = key.name  # For special keys
-        self.pressed_keys.discard(key_name)
+        self.pressed_keys.discard(self._key_name(key))
 
     def start(self):
         self.listener.start()
@@ -56,7 +74,10 @@ class KeyboardListener:
 
 
 def tool_control_from_key_presses(pressed_keys: set) -> ActuatorCommands:
-    if 'space' in pressed_keys:
+    # Pick out the direction keys once, the checks below only need this small set
+    direction_keys: set = pressed_keys & DIRECTION_KEYS
+
+    if 'space' in direction_keys:
         print("Set all to passive with empty command")
         return ActuatorCommands()
 
@@ -64,77 +85,59 @@ def tool_control_from_key_presses(pressed_keys: set) -> ActuatorCommands:
 
     # H-bridges controlled with 0, 1, 2, 3 & up / down arrows
     # up = forward, down = reverse, both = stop, neither / not pressed => omitted => passive
-    if 'up' in pressed_keys and 'down' in pressed_keys:
-        for hbridge_id in pressed_keys & {'0', '1', '2', '3'}:
-            commands.hbridges.append(HBridgeCommand(id=int(hbridge_id), command=HBridgeCommandType.HBRIDGE_STOPPED))
-    elif 'up' in pressed_keys:
-        for hbridge_id in pressed_keys & {'0', '1', '2', '3'}:
-            commands.hbridges.append(HBridgeCommand(id=int(hbridge_id), command=HBridgeCommandType.HBRIDGE_FORWARD))
-    elif 'down' in pressed_keys:
-        for hbridge_id in pressed_keys & {'0', '1', '2', '3'}:
-            commands.hbridges.append(HBridgeCommand(id=int(hbridge_id), command=HBridgeCommandType.HBRIDGE_REVERSE))
+    hbridge_command = HBRIDGE_COMMANDS.get(('up' in direction_keys, 'down' in direction_keys))
+    if hbridge_command is not None:
+        for hbridge_id in pressed_keys & HBRIDGE_KEYS:
+            commands.hbridges.add(id=int(hbridge_id), command=hbridge_command)
 
     # PTOs controlled with a, b, c, d & left / right arrows
     # left = forward, right = reverse, both = stop, neither / not pressed => omitted => passive
-    pto_id_mapping = {'a': 0x0, 'b': 0x1, 'c': 0x2, 'd': 0x3}
     pto_rpm: float = 20.0
-    if 'left' in pressed_keys and 'right' in pressed_keys:
-        for pto_char in pressed_keys & {'a', 'b', 'c', 'd'}:
-            pto_id = pto_id_mapping[pto_char]
-            commands.ptos.append(PtoCommand(id=pto_id, command=PtoCommandType.PTO_STOPPED, rpm=pto_rpm))
-    elif 'left' in pressed_keys:
-        for pto_char in pressed_keys & {'a', 'b', 'c', 'd'}:
-            pto_id = pto_id_mapping[pto_char]
-            commands.ptos.append(PtoCommand(id=pto_id, command=PtoCommandType.PTO_FORWARD, rpm=pto_rpm))
-    elif 'right' in pressed_keys:
-        for pto_char in pressed_keys & {'a', 'b', 'c', 'd'}:
-            pto_id = pto_id_mapping[pto_char]
-            commands.ptos.append(PtoCommand(id=pto_id, command=PtoCommandType.PTO_REVERSE, rpm=pto_rpm))
+    pto_command = PTO_COMMANDS.get(('left' in direction_keys, 'right' in direction_keys))
+    if pto_command is not None:
+        for pto_char in pressed_keys & PTO_KEYS:
+            commands.ptos.add(id=PTO_ID_MAPPING[pto_char], command=pto_command, rpm=pto_rpm)
 
     return commands
 
 
-async def control_tools(service_config_path: Path, keyboard_listener: KeyboardListener) -> None:
+async def control_tools(client: EventClient, keyboard_listener: KeyboardListener) -> None:
     """Control the tools / actuators on your Amiga.
 
     Args:
-        service_config_path (Path): The path to the canbus service config.
+        client (EventClient): The canbus service client.
         keyboard_listener (KeyboardListener): The keyboard listener.
     """
-    config: EventServiceConfig = proto_from_json_file(service_config_path, EventServiceConfig())
-    client: EventClient = EventClient(config)
-
     while True:
         # Send the tool control command
         commands: ActuatorCommands = tool_control_from_key_presses(keyboard_listener.pressed_keys)
-        await client.request_reply("/control_tools", commands, decode=True)
+        await client.request_reply("/control_tools", commands)
 
         # Sleep for a bit
         await asyncio.sleep(0.1)
 
 
-async def stream_tool_statuses(service_config_path: Path) -> None:
+async def stream_tool_statuses(client: EventClient) -> None:
     """Stream the tool statuses.
 
     Args:
-        service_config_path (Path): The path to the canbus service config.
+        client (EventClient): The canbus service client.
     """
-
-    config: EventServiceConfig = proto_from_json_file(service_config_path, EventServiceConfig())
-
     message: ToolStatuses
-    async for event, message in EventClient(config).subscribe(config.subscriptions[0], decode=True):
+    async for event, message in client.subscribe(client.config.subscriptions[0], decode=True):
         print("###################")
         print(message)
 
 
 async def run(service_config_path: Path, keyboard_listener: KeyboardListener):
-    # Create tasks for both functions
-    tasks: list[asyncio.Task] = [
-        asyncio.create_task(control_tools(service_config_path, keyboard_listener)),
-        asyncio.create_task(stream_tool_statuses(service_config_path)),
-    ]
-    await asyncio.gather(*tasks)
+    # Load the canbus service config once, for both functions
+    config: EventServiceConfig = proto_from_json_file(service_config_path, EventServiceConfig())
+
+    # Share one client, and so one channel, between both functions
+    client: EventClient = EventClient(config)
+
+    # Run both functions concurrently
+    await asyncio.gather(control_tools(client, keyboard_listener), stream_tool_statuses(client))
 
 
 if __name__ == "__main__":
@@ -144,6 +147,14 @@ if __name__ == "__main__":
     parser.add_argument("--service-config", type=Path, required=True, help="The canbus service config.")
     args = parser.parse_args()
 
+    # Use the libuv-based event loop when it is available
+    try:
+        import uvloop
+
+        uvloop.install()
+    except ImportError:
+        pass
+
     keyboard_listener = KeyboardListener()
     keyboard_listener.start()
 
@@ -27,74 +27,71 @@ from farm_ng.track.track_pb2 import TrackFollowRequest
 from google.protobuf.empty_pb2 import Empty
 
 
-async def set_track(service_config: EventServiceConfig, track: Track) -> None:
+async def set_track(client: EventClient, track: Track) -> None:
     """Set the track of the track_follower.
 
     Args:
-        service_config (EventServiceConfig): The track_follower service config.
+        client (EventClient): The track_follower service client.
         track (Track): The track for the track_follower to follow.
     """
     print(f"Setting track:\n{track}")
-    await EventClient(service_config).request_reply("/set_track", TrackFollowRequest(track=track))
+    await client.request_reply("/set_track", TrackFollowRequest(track=track))
 
 
-async def start(service_config: EventServiceConfig) -> None:
+async def start(client: EventClient) -> None:
     """Follow the track.
 
     Args:
-        service_config (EventServiceConfig): The track_follower service config.
+        client (EventClient): The track_follower service client.
     """
     print("Sending request to start following the track...")
-    await EventClient(service_config).request_reply("/start", Empty())
+    await client.request_reply("/start", Empty())
 
 
-async def main(service_config_path: Path, track_path: Path) -> None:
+async def main(client: EventClient, track_path: Path) -> None:
     """Run the track_follower track example. The robot will drive the pre-recorded track.
 
     Args:
-        service_config_path (Path): The path to the track_follower service config.
+        client (EventClient): The track_follower service client.
         track_path: (Path) The filepath of the track to follow.
     """
 
-    # Extract the track_follower service config from the JSON file
-    service_config: EventServiceConfig = proto_from_json_file(service_config_path, EventServiceConfig())
-
     # Read the track and package in a Track proto message
     track: Track = proto_from_json_file(track_path, Track())
 
     # Send the track to the track_follower
-    await set_track(service_config, track)
+    await set_track(client, track)
 
     # Follow the track
-    await start(service_config)
+    await start(client)
 
 
-async def stream_track_state(service_config_path: Path) -> None:
+async def stream_track_state(client: EventClient) -> None:
     """Stream the track_follower state.
 
     Args:
-        service_config_path (Path): The path to the track_follower service config.
+        client (EventClient): The track_follower service client.
     """
 
     # Brief wait to allow the track_follower to start (not necessary in practice)
     await asyncio.sleep(1)
     print("Streaming track_follower state...")
 
-    # create a client to the camera service
-    config: EventServiceConfig = proto_from_json_file(service_config_path, EventServiceConfig())
-
     message: TrackFollowerState
-    async for event, message in EventClient(config).subscribe(config.subscriptions[0], decode=True):
+    async for event, message in client.subscribe(client.config.subscriptions[0], decode=True):
         print("###################")
         print(message)
 
 
 async def run(args) -> None:
-    tasks: list[asyncio.Task] = [
-        asyncio.create_task(main(args.service_config, args.track)),
-        asyncio.create_task(stream_track_state(args.service_config)),
-    ]
-    await asyncio.gather(*tasks)
+    # Extract the track_follower service config from the JSON file once, for both tasks
+    service_config: EventServiceConfig = proto_from_json_file(args.service_config, EventServiceConfig())
+
+    # Share one client, and so one channel, for all requests and the state stream
+    client: EventClient = EventClient(service_config)
+
+    # Run both tasks concurrently
+    await asyncio.gather(main(client, args.track), stream_track_state(client))
 
 
 if __name__ == "__main__":
@@ -103,5 +100,12 @@ if __name__ == "__main__":
     parser.add_argument("--track", type=Path, required=True, help="The filepath of the track to follow.")
     args = parser.parse_args()
 
-    loop = asyncio.get_event_loop()
-    loop.run_until_complete(run(args))
+    # Use the libuv-based event loop when it is available
+    try:
+        import uvloop
+
+        uvloop.install()
+    except ImportError:
+        pass
+
+    asyncio.run(run(args))
@@ -15,11 +15,11 @@ from __future__ import annotations
 
 import argparse
 import asyncio
+import os
+import sys
 from math import radians
 from pathlib import Path
 
-import matplotlib
-import matplotlib.pyplot as plt
 import numpy as np
 from farm_ng.core.event_client import EventClient
 from farm_ng.core.event_service_pb2 import EventServiceConfig
@@ -31,37 +31,47 @@ from farm_ng_core_pybind import Pose3F64
 from google.protobuf.empty_pb2 import Empty
 from track_planner import TrackBuilder
 
-matplotlib.use("TkAgg")  # Set the backend to Agg for non-GUI environments
+# Zero velocity for the default start pose, read-only as it is shared (Pose3F64 copies it)
+_ZERO_TANGENT = np.zeros((6, 1), dtype=np.float64)
+_ZERO_TANGENT.setflags(write=False)
+
+# Parameters for arrow plotting
+ARROW_INTERVAL = 20  # Adjust this to change the frequency of arrows
+TURN_THRESHOLD = radians(10)  # Threshold in radians for when to skip plotting
 
 # Create a helper functions to print data
 
 
-def plot_track(waypoints: list[list[float]]) -> None:
-    x = waypoints[0]
-    y = waypoints[1]
-    headings = waypoints[2]
+def plot_track(waypoints: list[list[float]], headless_path: Path = Path("track.png")) -> None:
+    # Without a display to show the plot on (e.g. over SSH), render it off-screen to headless_path instead
+    headless: bool = sys.platform.startswith("linux") and not (
+        os.environ.get("DISPLAY") or os.environ.get("WAYLAND_DISPLAY")
+    )
+
+    # Import matplotlib only when plotting, it is slow to import and pulls in the Tk GUI backend
+    import matplotlib
 
-    # Calculate the arrow directions
-    U = np.cos(headings)
-    V = np.sin(headings)
+    matplotlib.use("Agg" if headless else "TkAgg")
+    import matplotlib.pyplot as plt
 
-    # Parameters for arrow plotting
-    arrow_interval = 20  # Adjust this to change the frequency of arrows
-    turn_threshold = np.radians(10)  # Threshold in radians for when to skip plotting
+    x = np.asarray(waypoints[0])
+    y = np.asarray(waypoints[1])
+    headings = np.asarray(waypoints[2])
 
     plt.figure(figsize=(8, 8))
     plt.plot(x, y, color='orange', linewidth=1.0)
 
-    for i in range(0, len(x), arrow_interval):
-        # Calculate the heading change
-        if i > 0:
-            heading_change = np.abs(headings[i] - headings[i - 1])
-        else:
-            heading_change = 0
+    # Calculate the heading change at each waypoint
+    heading_changes = np.abs(np.diff(headings, prepend=headings[0]))
 
-        # Plot the arrow if the heading change is below the threshold
-        if heading_change < turn_threshold:
-            plt.quiver(x[i], y[i], U[i], V[i], angles='xy', scale_units='xy', scale=3.5, color='blue')
+    # Plot an arrow every ARROW_INTERVAL waypoints, where the heading change is below the threshold
+    arrow_indices = np.arange(0, len(x), ARROW_INTERVAL)
+    keep = arrow_indices[heading_changes[arrow_indices] < TURN_THRESHOLD]
+
+    # Calculate the arrow directions, only for the plotted arrows
+    U = np.cos(headings[keep])
+    V = np.sin(headings[keep])
+    plt.quiver(x[keep], y[keep], U, V, angles='xy', scale_units='xy', scale=3.5, color='blue')
 
     plt.plot(x[0], y[0], marker="o", markersize=5, color='red')
     plt.axis("equal")
@@ -71,7 +81,12 @@ def plot_track(waypoints: list[list[float]]) -> None:
         plt.scatter([], [], color='red', marker='o', s=30, label='Start'),
     ]
     plt.legend(handles=legend_elements)
-    plt.show()
+
+    if headless:
+        plt.savefig(headless_path, dpi=100)
+        print(f"No display, plot saved to {headless_path}")
+    else:
+        plt.show()
 
 
 async def create_start_pose(client: EventClient | None = None, timeout: float = 0.5) -> Pose3F64:
@@ -84,32 +99,32 @@ async def create_start_pose(client: EventClient | None = None, timeout: float =
     """
     print("Creating start pose...")
 
-    zero_tangent = np.zeros((6, 1), dtype=np.float64)
-    start: Pose3F64 = Pose3F64(
-        a_from_b=Isometry3F64(), frame_a="world", frame_b="robot", tangent_of_b_in_a=zero_tangent
-    )
     if client is not None:
         try:
             # Get the current state of the filter
             state: FilterState = await asyncio.wait_for(
                 client.request_reply("/get_state", Empty(), decode=True), timeout=timeout
             )
-            start = Pose3F64.from_proto(state.pose)
+            return Pose3F64.from_proto(state.pose)
         except asyncio.TimeoutError:
             print("Timeout while getting filter state. Using default start pose.")
         except Exception as e:
             print(f"Error getting filter state: {e}. Using default start pose.")
 
-    return start
+    # Fall back to the default start pose, at the origin and at rest
+    return Pose3F64(a_from_b=Isometry3F64(), frame_a="world", frame_b="robot", tangent_of_b_in_a=_ZERO_TANGENT)
 
 
-async def build_track(reverse: bool, client: EventClient | None = None, save_track: Path | None = None) -> Track:
+async def build_track(
+    reverse: bool, client: EventClient | None = None, save_track: Path | None = None, plot: bool = True
+) -> Track:
     """Builds a custom track for the Amiga to follow.
 
     Args:
         reverse: Whether or not to reverse the track
         client: A EventClient for the required service (filter)
         save_track: The path to save the track to
+        plot: Whether or not to plot the track (blocks until the plot window is closed)
     Returns:
         The track
     """
@@ -126,41 +141,24 @@ async def build_track(reverse: bool, client: EventClient | None = None, save_tra
 
     track_builder = TrackBuilder(start=start)
 
-    # Drive forward 32 ft (up row 2)
-    track_builder.create_straight_segment(next_frame_b="goal1", distance=row_length, spacing=0.1)
-
-    # Maneuver at the end of row: skip one row (96 inches) - (go from 2 to 4)
-    track_builder.create_arc_segment(next_frame_b="goal2", radius=row_spacing, angle=radians(180), spacing=0.1)
-
-    # Drive forward 32 ft (down 4)
-    track_builder.create_straight_segment(next_frame_b="goal3", distance=row_length, spacing=0.1)
-
-    # Maneuver at the end of row: skip two rows (144 inches) - (go from 4 to 1)
-    track_builder.create_arc_segment(next_frame_b="goal4", radius=1.5 * row_spacing, angle=radians(180), spacing=0.1)
-
-    # Drive forward 32 ft (up 1)
-    track_builder.create_straight_segment(next_frame_b="goal5", distance=row_length, spacing=0.1)
-
-    # Maneuver at the end of row: skip one row (96 inches) - (go from 1 to 3)
-    track_builder.create_arc_segment(next_frame_b="goal6", radius=row_spacing, angle=radians(180), spacing=0.1)
-
-    # Drive forward 32 ft (down 3)
-    track_builder.create_straight_segment(next_frame_b="goal7", distance=row_length, spacing=0.1)
-
-    # Maneuver at the end of row: skip one row (96 inches) - (go from 3 to 1)
-    track_builder.create_arc_segment(next_frame_b="goal8", radius=row_spacing, angle=radians(180), spacing=0.1)
-
-    # Drive forward 32 ft (up 1)
-    track_builder.create_straight_segment(next_frame_b="goal9", distance=row_length, spacing=0.1)
-
-    # Maneuver at the end of row: skip two rows (144 inches) - (go from 1 to 4)
-    track_builder.create_arc_segment(next_frame_b="goal10", radius=1.5 * row_spacing, angle=radians(180), spacing=0.1)
-
-    # Drive forward 32 ft (down 4)
-    track_builder.create_straight_segment(next_frame_b="goal11", distance=row_length, spacing=0.1)
+    # Each row is driven forward 32 ft, followed by a maneuver at the end of the row onto the next row
+    # Maneuvers as (radius, angle in degrees), skipping one row (96 inches) or two rows (144 inches)
+    maneuvers: list[tuple[float, float]] = [
+        (row_spacing, 180),  # up row 2, skip one row (go from 2 to 4)
+        (1.5 * row_spacing, 180),  # down row 4, skip two rows (go from 4 to 1)
+        (row_spacing, 180),  # up row 1, skip one row (go from 1 to 3)
+        (row_spacing, 180),  # down row 3, skip one row (go from 3 to 1)
+        (1.5 * row_spacing, 180),  # up row 1, skip two rows (go from 1 to 4)
+        (row_spacing, 175),  # down row 4, skip one row (go from 4 to 2 - slightly before the start)
+    ]
+    for row, (radius, angle) in enumerate(maneuvers):
+        # Drive forward 32 ft
+        track_builder.create_straight_segment(next_frame_b=f"goal{2 * row + 1}", distance=row_length, spacing=0.1)
 
-    # Maneuver at the end of row: skip one row (96 inches) - (go from 4 to 2 - slightly before the start)
-    track_builder.create_arc_segment(next_frame_b="goal12", radius=row_spacing, angle=radians(175), spacing=0.1)
+        # Maneuver at the end of row
+        track_builder.create_arc_segment(
+            next_frame_b=f"goal{2 * row + 2}", radius=radius, angle=radians(angle), spacing=0.1
+        )
 
     if reverse:
         track_builder.reverse_track()
@@ -173,8 +171,9 @@ async def build_track(reverse: bool, client: EventClient | None = None, save_tra
         track_builder.save_track(save_track)
 
     # Plot the track
-    waypoints = track_builder.unpack_track()
-    plot_track(waypoints)
+    if plot:
+        waypoints = track_builder.unpack_track()
+        plot_track(waypoints, save_track.with_suffix(".png") if save_track is not None else Path("track.png"))
     return track_builder.track
 
 
@@ -192,9 +191,8 @@ async def run(args) -> None:
         if client.config.name != "filter":
             raise RuntimeError(f"Expected filter service in {args.service_config}, got {client.config.name}")
 
-    # Start the asyncio tasks
-    tasks: list[asyncio.Task] = [asyncio.create_task(build_track(reverse, client, save_track))]
-    await asyncio.gather(*tasks)
+    # Build the track
+    await build_track(reverse, client, save_track, plot=not args.no_plot)
 
 
 if __name__ == "__main__":
@@ -202,8 +200,16 @@ if __name__ == "__main__":
     parser.add_argument("--save-track", type=Path, help="Save the track to a file.")
     parser.add_argument("--reverse", action='store_true', help="Reverse the track.")
     parser.add_argument("--service-config", type=Path, help="Path to the service config file.")
+    parser.add_argument("--no-plot", action='store_true', help="Skip plotting the track, e.g. when only saving it.")
     args = parser.parse_args()
 
-    # Create the asyncio event loop and run the main function
-    loop = asyncio.get_event_loop()
-    loop.run_until_complete(run(args))
+    # Use the libuv-based event loop when it is available
+    try:
+        import uvloop
+
+        uvloop.install()
+    except ImportError:
+        pass
+
+    # Run the main function
+    asyncio.run(run(args))
@@ -60,11 +60,12 @@ class TrackBuilder:
 
         delta_angle: float = angle / num_segments
         delta_distance: float = distance / num_segments
+
+        # Every step of the segment is the same, so build its transform once
+        step: Isometry3F64 = Isometry3F64([delta_distance, 0, 0], Rotation3F64.Rz(delta_angle))
         for i in range(1, num_segments + 1):
             segment_pose: Pose3F64 = Pose3F64(
-                a_from_b=Isometry3F64([delta_distance, 0, 0], Rotation3F64.Rz(delta_angle)),
-                frame_a=segment_poses[-1].frame_b,
-                frame_b=f"{next_frame_b}_{i - 1}",
+                a_from_b=step, frame_a=segment_poses[-1].frame_b, frame_b=f"{next_frame_b}_{i - 1}"
             )
             segment_poses.append(segment_poses[-1] * segment_pose)
 